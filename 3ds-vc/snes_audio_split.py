@@ -1,3 +1,4 @@
+import mmap
 import os
 import struct
 
@@ -11,19 +12,20 @@ if __name__ == '__main__':
     fabs = os.sys.argv[1]
 
     try:
-        with open(fabs, "rb") as fi:
-            b = bytearray(fi.read())
-            rom_size = struct.unpack('<I', b[0x31:0x34] + b'\0')[0]
-            rom_data = b[0x60:0x60 + rom_size]
+        with open(fabs, "rb") as fi, \
+                mmap.mmap(fi.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as b:
+            # the ROM size is a 24-bit value, so drop the byte that follows it
+            rom_size = struct.unpack_from('<I', b, 0x31)[0] & 0xffffff
             print(f'ROM size: {rom_size} ({hex(rom_size)})')
+            pcm_size = max(len(b) - (0x60 + rom_size), 0)
+            print(f'PCM size: {pcm_size} ({hex(pcm_size)})')
 
-            pcm_data = b[0x60 + rom_size:]
-            print(f'PCM size: {len(pcm_data)} ({hex(len(pcm_data))})')
-
-            with open('game.rom', 'wb') as fo:
+            # the slices must be released before the map closes, even on error
+            with b[0x60:0x60 + rom_size] as rom_data, open('game.rom', 'wb') as fo:
                 fo.write(rom_data)
 
-            with open('game.pcm', 'wb') as fo:
+            with b[0x60 + rom_size:] as pcm_data, open('game.pcm', 'wb') as fo:
                 fo.write(pcm_data)
 
         print('SUCCESS')
@@ -1,5 +1,7 @@
 import click
 
+from ..fileio import read_bin_file, write_bin_file
+
 @click.command()
 @click.option('--in', 'in_file', help = 'path to input file', required=True)
 @click.option('--out1', 'out_file1', help = 'path to output file 1', required=True)
@@ -11,31 +13,20 @@ def deinterleave(in_file, out_file1, out_file2):
     # deinterleaved = [in_data[idx::CHANNEL_COUNT] for idx in range(CHANNEL_COUNT)]
     # write_bin_file(deinterleaved[0], out_file1)
     # write_bin_file(deinterleaved[1], out_file2)
-    data1 = bytearray()
-    data2 = bytearray()
-    for idx in range(len(in_data)):
-        mod_val = idx % 4
-        if mod_val == 0 or mod_val == 1:
-            data1.append(in_data[idx])
+    # The outputs alternate 2-byte words, so view the input as 16-bit words and
+    # take every other one; each output is then one strided copy done in C
+    even_length = len(in_data) - len(in_data) % 2
+    words = memoryview(in_data)[:even_length].cast('H')
+    data1 = bytearray(words[0::2].tobytes())
+    data2 = bytearray(words[1::2].tobytes())
+    if even_length != len(in_data):
+        # a trailing odd byte is the first half of the next word
+        if even_length % 4 == 0:
+            data1.append(in_data[-1])
         else:
-            data2.append(in_data[idx])
+            data2.append(in_data[-1])
 
 
     write_bin_file(data1, out_file1)
     write_bin_file(data2, out_file2)
 
-def read_bin_file(path):
-    try: 
-        with open(path, "rb") as f:
-            content = f.read()
-            return content
-    except IOError:
-        print(f"Error reading {path}!")   
-
-def write_bin_file(data, path):
-    try: 
-        with open(path, "wb") as f:
-            f.write(data)
-    except IOError:
-        print(f"Error writing {path}!")  
-
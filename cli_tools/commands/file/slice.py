@@ -1,7 +1,11 @@
 import click
+import mmap
+import os
 import sys
 import zlib
 
+from ..fileio import write_bin_file
+
 @click.command()
 @click.option('--in', 'in_file', help = 'path to input file', required=True)
 @click.option('--out', 'out_file', help = 'path to output file', required=True)
@@ -10,28 +14,26 @@ import zlib
 def slice(in_file, out_file, start, length):
     """Slice a portion of a file to a new file"""
 
-    def read_bin_file(path):
-        try: 
-            with open(path, "rb") as f:
-                content = f.read()
-                return content
-        except IOError:
-            print(f"Error reading {path}!")   
-
-    def write_bin_file(data, path):
-        try: 
-            with open(path, "wb") as f:
-                f.write(data)
-        except IOError:
-            print(f"Error writing {path}!")  
-
-
     print(f"Pulling {length} bytes from {in_file} starting at {start}")
     print(f"Saving to {out_file}")
 
-    in_data = read_bin_file(in_file)
-    out_data = in_data[int(start):int(start + length)]
-    write_bin_file(out_data, out_file)
-    crc_val = zlib.crc32(out_data)
+    # map the input so only the pages in the requested range are read from
+    # disk; the memoryview slice is written without a copy
+    try:
+        with open(in_file, 'rb') as f:
+            # mmap refuses empty files, and an empty file has nothing to map anyway
+            mapped = os.fstat(f.fileno()).st_size > 0
+            in_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if mapped else b''
+    except IOError:
+        print(f"Error reading {in_file}!")
+        return
+
+    try:
+        with memoryview(in_data)[int(start):int(start + length)] as out_data:
+            write_bin_file(out_data, out_file)
+            crc_val = zlib.crc32(out_data)
+    finally:
+        if mapped:
+            in_data.close()
 
     print(f"Saved to {out_file} and calculated CRC {hex(crc_val)}")
\ No newline at end of file
@@ -0,0 +1,21 @@
+import os
+
+
+def read_bin_file(path):
+    try: 
+        with open(path, "rb") as f:
+            content = f.read()
+            return content
+    except IOError:
+        print(f"Error reading {path}!")   
+
+def write_bin_file(data, path):
+    try: 
+        with open(path, "wb") as f:
+            f.write(data)
+    except IOError:
+        print(f"Error writing {path}!")  
+
+def list_files(dir):
+    with os.scandir(dir) as entries:
+        return [entry.path for entry in entries if not entry.is_dir()]
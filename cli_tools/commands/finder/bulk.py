@@ -1,6 +1,9 @@
 import click
 import os
 import psutil
+from concurrent.futures import ThreadPoolExecutor
+
+from ..fileio import list_files, read_bin_file
 
 
 @click.command()
@@ -15,40 +18,20 @@ def bulk(target_dir, search_dir):
         file_data = read_bin_file(file_path)
         file_cache[file_path] = file_data
 
-    def read_bin_file(path):
-        try: 
-            with open(path, "rb") as f:
-                content = f.read()
-                return content
-        except IOError:
-            print('Error While Opening the file!')  
-    
     def find_match(archive_content, sub_content):
-        for i in range(0x0, len(archive_content) - len(sub_content)):
-            if archive_content[i] == sub_content[0]:
-                valid = True
-                for j in range(0, len(sub_content)-1):
-                    if archive_content[i+j] != sub_content[j]:
-                        valid = False
-                        break
-                if valid:
-                    return {'start': i, 'end': i+len(sub_content)}
-        return None
+        i = archive_content.find(sub_content)
+        if i == -1:
+            return None
+        return {'start': i, 'end': i+len(sub_content)}
         
-    def list_child_files(child_path):
-        child_files = []
-        for (dirpath, dirnames, filenames) in os.walk(child_path):
-            for filename in filenames:
-                child_files.append(os.path.join(child_path, filename))
-            break
-        return child_files
+    # memory usage is reported after every comparison, so look the process up once
+    process = psutil.Process(os.getpid())
 
     def memory_usage():
-        process = psutil.Process(os.getpid())
         print(f"Using {process.memory_info().rss} bytes...")  # in bytes
 
-    search_files = list_child_files(search_dir)
-    target_files = list_child_files(target_dir)
+    search_files = list_files(search_dir)
+    target_files = list_files(target_dir)
 
     matches = []
         
@@ -61,16 +44,23 @@ def bulk(target_dir, search_dir):
     memory_usage()
 
     print(f"Searching...")
-    for search_file in search_files:
-        print(f" Searching {search_file}...")
-        search_content = read_bin_file(search_file)
+    # Read the next search file on a worker thread while the current one is
+    # searched; file reads release the GIL, so the disk and the scan overlap
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if search_files:
+            next_content = executor.submit(read_bin_file, search_files[0])
+        for idx, search_file in enumerate(search_files):
+            print(f" Searching {search_file}...")
+            search_content = next_content.result()
+            if idx + 1 < len(search_files):
+                next_content = executor.submit(read_bin_file, search_files[idx + 1])
 
-        for target_file in target_files:
-            target_content = file_cache[target_file]
-            match = find_match(search_content, target_content)
-            if match == None:
-                print(f"  No match found for {target_file}") 
-            else:
-                print(f"  Match for {target_file} from {hex(match['start'])} to {hex(match['end'])}!")
-                matches.append(match)
-            memory_usage()
+            for target_file in target_files:
+                target_content = file_cache[target_file]
+                match = find_match(search_content, target_content)
+                if match == None:
+                    print(f"  No match found for {target_file}") 
+                else:
+                    print(f"  Match for {target_file} from {hex(match['start'])} to {hex(match['end'])}!")
+                    matches.append(match)
+                memory_usage()
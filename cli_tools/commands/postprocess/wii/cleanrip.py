@@ -1,16 +1,63 @@
 import click
 import os
 import re
+import shutil
+import sys
 import zlib
 
+from ...fileio import list_files
 
-def list_files(dir):
-    files = []
-    for (dirpath, dirnames, filenames) in os.walk(dir):
-        for filename in filenames:
-            files.append(os.path.join(dir, filename))
-        break
-    return files
+BLOCK_SIZE = 4 * 1024 * 1024
+USE_SENDFILE = hasattr(os, 'sendfile') and sys.platform.startswith('linux')
+
+# Yields the contents of the given files in order, a block at a time, so a
+# multi-part disc image never has to be held in memory all at once. Every
+# block is a view of the same reused buffer, so use each one before asking
+# for the next.
+def read_blocks(paths, block_size=BLOCK_SIZE):
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+    for path in paths:
+        with open(path, 'rb') as infile:
+            while True:
+                size = infile.readinto(buffer)
+                if not size:
+                    break
+                yield view[:size]
+
+# Appends the contents of the file at path to outfile; on Linux the copy is done
+# by the kernel with sendfile, so the data never passes through Python
+def append_file(path, outfile):
+    with open(path, 'rb') as infile:
+        if not USE_SENDFILE:
+            shutil.copyfileobj(infile, outfile, BLOCK_SIZE)
+            return
+        outfile.flush()
+        size = os.fstat(infile.fileno()).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(outfile.fileno(), infile.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+
+# Verifies a set's CRC and, if it matches, writes the reassembled image to dest_dir
+def rebuild_set(current_set, src_dir, dest_dir):
+    print(f"Reading parts for {current_set['name']}...")
+    part_paths = [os.path.join(src_dir, partname) for partname in current_set['parts']]
+    
+    print(f"Checking checksum for {current_set['name']}...")
+    crc = 0
+    for block in read_blocks(part_paths):
+        crc = zlib.crc32(block, crc)
+    expected_crc = int(current_set['crc'], 16)
+    if crc != expected_crc:
+        print(f"CRC does not match for {current_set['name']} - found {hex(crc)}, expected {hex(expected_crc)} - skipping set!")
+    else:
+        print(f"Creating file for {current_set['name']}...")
+        with open(os.path.join(dest_dir, f"{current_set['safename']}.iso"), 'wb') as outfile:
+            for part_path in part_paths:
+                append_file(part_path, outfile)
 
 @click.command()
 @click.option('--srcdir', 'src_dir', help = 'path to directory with cleanrip output files', required=True)
@@ -105,19 +152,7 @@ def cleanrip(src_dir, dest_dir):
         print(f"    {current_set['parts']}")
         print(f"    {current_set['crc']}")
     
-    for set_id in sets.keys():
-        current_set = sets[set_id]
-        print(f"Reading parts for {current_set['name']}...")
-        content = bytes()
-        for partname in current_set['parts']:
-            with open(os.path.join(src_dir, partname), 'rb') as infile:
-                content += infile.read()
-        
-        print(f"Checking checksum for {current_set['name']}...")
-        crc_val = hex(zlib.crc32(content))
-        if crc_val != hex(int(current_set['crc'], 16)):
-            print(f"CRC does not match - found {crc_val}, expected {hex(int(current_set['crc'], 16))} - skipping set!")
-        else:
-            print(f"Creating file for {current_set['name']}...")
-            with open(os.path.join(dest_dir, f"{current_set['safename']}.iso"), 'wb') as outfile:
-                outfile.write(content)
+    # sets are rebuilt one at a time: dumps usually share a single drive, where
+    # concurrent reads only compete with each other, and the log stays in order
+    for current_set in sets.values():
+        rebuild_set(current_set, src_dir, dest_dir)
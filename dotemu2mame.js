@@ -182,13 +182,15 @@ function encode_gfx(buf, layout)
     return dest;
 }
 
+// ROMs are stored uncompressed: MAME reads stored and deflated zips alike,
+// and skipping the deflate pass makes building the set much faster
 function zip(name, dir)
 {
     let cmd;
     if (os.type() === 'Windows_NT')
-        cmd = `powershell Add-Type -AssemblyName System.IO.Compression.FileSystem; [System.IO.Compression.ZipFile]::CreateFromDirectory('${dir}', '${name}.zip')`;
+        cmd = `powershell Add-Type -AssemblyName System.IO.Compression, System.IO.Compression.FileSystem; [System.IO.Compression.ZipFile]::CreateFromDirectory('${dir}', '${name}.zip', [System.IO.Compression.CompressionLevel]::NoCompression, $false)`;
     else
-        cmd = `zip -j ${name}.zip ${dir}/*`;
+        cmd = `zip -0 -j ${name}.zip ${dir}/*`;
     child_process.execSync(cmd);
 }
 
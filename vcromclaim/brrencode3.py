@@ -55,6 +55,8 @@ class BRREncoder(object):
 		self.ADPCMMash(smin, kmin, PCMData, True)
 	
 	# double ADPCMMash(int shiftamount, int filter, short[] PCMData, boolean write)
+	# This is called up to 53 times per 16-sample block, so clamp_16 and sshort
+	# are inlined and the per-sample values are kept in locals.
 	def ADPCMMash(self, shiftamount, filter, PCMData, write):
 		d2=0.0
 		vlin=0
@@ -62,7 +64,8 @@ class BRREncoder(object):
 		l2 = self.p2
 		step = 1<<shiftamount
 		
-		for i in range(16):
+		for i in xrange(16):
+			sample = PCMData[i]
 			# Compute linear prediction for filters
 			if filter == 0:
 				pass
@@ -80,7 +83,7 @@ class BRREncoder(object):
 				vlin -= l2>>1
 				vlin += (l2+(l2>>1))>>4
 			
-			d = (PCMData[i]>>1) - vlin		# Difference between linear prediction and current sample
+			d = (sample>>1) - vlin		# Difference between linear prediction and current sample
 			da = abs(d)
 
 			if da > 16384 and da < 32768:
@@ -101,8 +104,12 @@ class BRREncoder(object):
 				dp = ( dp >> 14 ) & ~0x7FF
 			c &= 0x0f						# mask to 4 bits
 			l2 = l1							# shift history
-			l1 = self.sshort(self.clamp_16(vlin + dp)*2)
-			d = PCMData[i]-l1
+			l1 = vlin + dp					# l1 = sshort(clamp_16(vlin + dp)*2)
+			if l1 > 0x7FFF: l1 = 0x7FFF - (l1>>24)
+			l1 *= 2
+			if l1 > 0x7FFF: l1 -= 0x10000
+			elif l1 < -0x8000: l1 &= 0x7FFF
+			d = sample-l1
 			d2 += float(d)*d				# update square-error
 
 			if write:						# if we want output, put it in proper place */
@@ -15,6 +15,7 @@ class CCFArchive(object):
 		else:
 			self.file = archive
 		self.files = []
+		self.filesbyname = {} # name -> FileDescriptor, for lookups by exact name
 		self.readheader()
 	
 	def readheader(self):
@@ -23,27 +24,26 @@ class CCFArchive(object):
 		assert zeroes1 == 12 * '\0'
 		assert rootnode_offset == 0x20
 		assert zeroes2 == 8 * '\0'
+		# read the whole descriptor table at once and decode each record from memory
+		table = self.file.read(32 * numfiles)
 		for i in range(numfiles):
-			fd = FileDescriptor(self.file)
+			fd = FileDescriptor(table, 32 * i)
 			self.files.append(fd)
+			self.filesbyname[fd.name] = fd
 	
 	def hasfile(self, path):
-		for f in self.files:
-			if f.name == path: return True
-		return False
+		return path in self.filesbyname
 	
 	def getfile(self, path):
 		assert self.hasfile(path)
-		fd = None
-		for f in self.files:
-			if f.name == path: fd = f
-		return self.getfile2(fd)
+		return self.getfile2(self.filesbyname[path])
 	
 	def getfile2(self, fd):
 		self.file.seek(fd.data_offset * 32)
 		string = self.file.read(fd.size)
 		if fd.compressed:
-			string = zlib.decompress(string)
+			# the descriptor gives the exact output size, so allocate it up front
+			string = zlib.decompress(string, zlib.MAX_WBITS, fd.decompressed_size)
 			assert len(string) == fd.decompressed_size
 		return StringIO(string)
 	
@@ -54,9 +54,12 @@ class CCFArchive(object):
 		return None
 
 class FileDescriptor(object):
-	# f: a file-like object of a CCF file at the position of this file descriptor
-	def __init__(self, f):
-		self.name, self.data_offset, self.size, self.decompressed_size = struct.unpack('<20sIII', f.read(32))
+	entry = struct.Struct('<20sIII')
+	
+	# table: string containing the CCF file descriptor table
+	# offset: position of this file descriptor within the table
+	def __init__(self, table, offset):
+		self.name, self.data_offset, self.size, self.decompressed_size = self.entry.unpack_from(table, offset)
 		self.name = self.name[0:self.name.find('\0')]
 		self.compressed = (self.size != self.decompressed_size)
 
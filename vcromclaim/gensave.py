@@ -19,10 +19,13 @@ def convert(src, dest):
 	size = struct.unpack('<I', infile.read(4))[0] # size of expanded file; equal to (size1 - 0x8)
 	assert size == size1 - 0x8
 	
-	while outfile.tell() < size:
-		data = infile.read(512)
-		intdata = struct.unpack('>512B', data)
-		outfile.write(struct.pack('>512H', *intdata))
+	# each SRAM byte becomes the low byte of a big-endian 16-bit word
+	count = (size + 1023) // 1024 * 512
+	data = infile.read(count)
+	if len(data) != count: raise ValueError('save file is shorter than its header says')
+	expanded = bytearray(2 * count)
+	expanded[1::2] = data
+	outfile.write(expanded)
 	
 	outfile.close()
 	infile.close()
@@ -29,37 +29,42 @@ def decompress(infile, outfile):
 	print "decoded size = %ld bytes" % decoded_length
 	'''
 
-	# decode
+	# decode into a buffer allocated at the final size, then write it out in one go;
+	# whatever was decoded is still written if the stream turns out to be bad
+	outbuf = array('B', '\0' * decoded_length)
 	bits = 0
 	bits_left = 0
 	table_offset = 0
 	bytes_decoded = 0
 
-	while bytes_decoded < decoded_length:
-		if bits_left == 0:
-			bits = struct.unpack("<I", infile.read(4))[0]
-			bits_left = 32
+	try:
+		while bytes_decoded < decoded_length:
+			if bits_left == 0:
+				bits = struct.unpack("<I", infile.read(4))[0]
+				bits_left = 32
 
-		current_bit = ((bits & 0x80000000) != 0)
-		next_offset = (((table_offset + 1) / 2 * 2) + 1 +
-			(decode_table[table_offset] & 0x3f) * 2 +
-			current_bit)
+			current_bit = ((bits & 0x80000000) != 0)
+			next_offset = (((table_offset + 1) / 2 * 2) + 1 +
+				(decode_table[table_offset] & 0x3f) * 2 +
+				current_bit)
 
-		if next_offset >= decode_table_size:
-			raise ValueError("reading past end of decode table")
+			if next_offset >= decode_table_size:
+				raise ValueError("reading past end of decode table")
 
-		if ((not current_bit and (decode_table[table_offset] & 0x80)) or
-			(    current_bit and (decode_table[table_offset] & 0x40))):
-			outfile.write(chr(decode_table[next_offset]))
-			bytes_decoded += 1
-			# print "%02x" % decode_table[next_offset]
-			next_offset = 0
+			if ((not current_bit and (decode_table[table_offset] & 0x80)) or
+				(    current_bit and (decode_table[table_offset] & 0x40))):
+				outbuf[bytes_decoded] = decode_table[next_offset]
+				bytes_decoded += 1
+				# print "%02x" % decode_table[next_offset]
+				next_offset = 0
 		
-		if next_offset == table_offset:
-			raise ValueError("infinite loop in Huf8 decompression")
-		table_offset = next_offset
-		bits_left -= 1
-		bits <<= 1
+			if next_offset == table_offset:
+				raise ValueError("infinite loop in Huf8 decompression")
+			table_offset = next_offset
+			bits_left -= 1
+			bits <<= 1
+	finally:
+		outfile.write(outbuf[:bytes_decoded].tostring())
 
 if __name__ == "__main__":
 	import sys
@@ -22,24 +22,36 @@ class BaseLZ77(object):
 		offset = 0
  
 		self.file.seek(self.offset + 0x4)
+		src = self.file.read()
+		pos = 0
  
 		while offset < self.uncompressed_length:
-			flags = ord(self.file.read(1))
+			flags = ord(src[pos])
+			pos += 1
  
 			for i in xrange(8):
 				if flags & 0x80:
-					info = struct.unpack(">H", self.file.read(2))[0]
+					info = struct.unpack_from(">H", src, pos)[0]
+					pos += 2
 					num = 3 + (info>>12)
 					disp = info & 0xFFF
 					ptr = offset - disp - 1
-					for i in xrange(num):
-						dout[offset] = dout[ptr]
-						ptr += 1
-						offset += 1
-						if offset >= self.uncompressed_length:
-							break
+					count = min(num, self.uncompressed_length - offset)
+					if ptr >= 0 and ptr + count <= offset:
+						# the source run ends before the output position, so no byte depends
+						# on one written by this copy and the whole run can move as one slice
+						dout[offset:offset+count] = dout[ptr:ptr+count]
+						offset += count
+					else:
+						for i in xrange(num):
+							dout[offset] = dout[ptr]
+							ptr += 1
+							offset += 1
+							if offset >= self.uncompressed_length:
+								break
 				else:
-					dout[offset] = self.file.read(1)
+					dout[offset] = src[pos]
+					pos += 1
 					offset += 1
 				flags <<= 1
 				if offset >= self.uncompressed_length:
@@ -57,33 +69,47 @@ class BaseLZ77(object):
 		if not self.uncompressed_length:
 			self.uncompressed_length = struct.unpack("<I", self.file.read(4))[0]
 		
+		src = self.file.read()
+		pos = 0
+		
 		while offset < self.uncompressed_length:
-			flags = ord(self.file.read(1))
+			flags = ord(src[pos])
+			pos += 1
 			
 			for i in xrange(7, -1, -1):
 				if (flags & (1<<i)) > 0:
-					info = struct.unpack(">H", self.file.read(2))[0]
+					info = struct.unpack_from(">H", src, pos)[0]
+					pos += 2
 					ptr, num = 0, 0
 					if info < 0x2000:
 						if info >= 0x1000:
-							info2 = struct.unpack(">H", self.file.read(2))[0]
+							info2 = struct.unpack_from(">H", src, pos)[0]
+							pos += 2
 							ptr = offset - (info2 & 0xFFF) - 1
 							num = (((info & 0xFFF) << 4) | (info2 >> 12)) + 273
 						else:
-							info2 = ord(self.file.read(1))
+							info2 = ord(src[pos])
+							pos += 1
 							ptr = offset - (((info & 0xF) << 8) | info2) - 1
 							num = ((info&0xFF0)>>4) + 17
 					else:
 						ptr = offset - (info & 0xFFF) - 1
 						num = (info>>12) + 1
-					for i in xrange(num):
-						dout[offset] = dout[ptr]
-						offset += 1
-						ptr += 1
-						if offset >= self.uncompressed_length:
-							break
+					count = min(num, self.uncompressed_length - offset)
+					if ptr >= 0 and ptr + count <= offset:
+						# non-overlapping run; copy it as one slice
+						dout[offset:offset+count] = dout[ptr:ptr+count]
+						offset += count
+					else:
+						for i in xrange(num):
+							dout[offset] = dout[ptr]
+							offset += 1
+							ptr += 1
+							if offset >= self.uncompressed_length:
+								break
 				else:
-					dout[offset] = self.file.read(1)
+					dout[offset] = src[pos]
+					pos += 1
 					offset += 1
 				
 				if offset >= self.uncompressed_length:
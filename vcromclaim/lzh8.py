@@ -70,7 +70,8 @@ bits_left = 0
 		uint8_t * const bit_pool_p,
 		int * const bits_left_p,
 		const int bit_count)'''
-def get_next_bits(infile, bit_count):
+# src: the whole compressed file as an array of bytes
+def get_next_bits(src, bit_count):
 	global input_offset, bit_pool, bits_left
 	
 	offset_p = input_offset
@@ -81,8 +82,7 @@ def get_next_bits(infile, bit_count):
 	num_bits_produced = 0
 	while num_bits_produced < bit_count:
 		if bits_left_p == 0:
-			infile.seek(offset_p)
-			bit_pool_p = struct.unpack("<B", infile.read(1))[0]
+			bit_pool_p = src[offset_p]
 			bits_left_p = 8
 			offset_p += 1
 		
@@ -104,6 +104,19 @@ def get_next_bits(infile, bit_count):
 	
 	return out_bits
 
+# get_next_bits(src, 1) specialized for the single-bit reads made while
+# walking the Huffman trees, which account for almost every call
+def get_next_bit(src):
+	global input_offset, bit_pool, bits_left
+	
+	if bits_left == 0:
+		bit_pool = src[input_offset]
+		bits_left = 8
+		input_offset += 1
+	
+	bits_left -= 1
+	return (bit_pool >> bits_left) & 1
+
 # void analyze_LZH8(FILE *infile, FILE *outfile, long file_length)
 def decompress(infile):
 	global input_offset, bit_pool, bits_left
@@ -115,6 +128,9 @@ def decompress(infile):
 	infile.seek(0, os.SEEK_END)
 	file_length = infile.tell()
 	
+	infile.seek(0)
+	src = array('B', infile.read())
+	
 	# read header
 	infile.seek(input_offset)
 	header = struct.unpack("<I", infile.read(4))[0]
@@ -141,7 +157,7 @@ def decompress(infile):
 	while (input_offset - start_input_offset) < length_table_bytes:
 		if i >= length_decode_table_size:
 			break
-		length_decode_table[i] = get_next_bits(infile, LENBITS)
+		length_decode_table[i] = get_next_bits(src, LENBITS)
 		i += 1
 		#if SHOW_TABLE: print "%ld: %d" % (i-1, length_decode_table[i-1])
 	input_offset = start_input_offset + length_table_bytes
@@ -162,7 +178,7 @@ def decompress(infile):
 	while (input_offset - start_input_offset < displen_table_bytes):
 		if i >= length_decode_table_size:
 			break
-		displen_decode_table[i] = get_next_bits(infile, DISPBITS)
+		displen_decode_table[i] = get_next_bits(src, DISPBITS)
 		i += 1
 		#if SHOW_TABLE: print "%ld: %d" % (i-1, displen_decode_table[bit_pool = 0 # uint8_ti-1])
 	input_offset = start_input_offset + displen_table_bytes
@@ -178,7 +194,7 @@ def decompress(infile):
 
 		# get next backreference length or literal byte
 		while True:
-			next_length_child = get_next_bits(infile, 1)
+			next_length_child = get_next_bit(src)
 			length_node_payload = length_decode_table[length_table_offset] & 0x7F
 			next_length_table_offset =  (length_table_offset / 2 * 2) + (length_node_payload + 1) * 2 + bool(next_length_child)
 			next_length_child_isleaf = length_decode_table[length_table_offset] & (0x100 >> next_length_child)
@@ -197,7 +213,7 @@ def decompress(infile):
 					
 					# get backreference displacement length
 					while True:
-						next_displen_child = get_next_bits(infile, 1)
+						next_displen_child = get_next_bit(src)
 						displen_node_payload = displen_decode_table[displen_table_offset] & 0x7
 						next_displen_table_offset = (displen_table_offset / 2 * 2) + (displen_node_payload + 1) * 2 + bool(next_displen_child)
 						next_displen_child_isleaf = displen_decode_table[displen_table_offset] & (0x10 >> next_displen_child)
@@ -213,7 +229,7 @@ def decompress(infile):
 								#for (uint16_t i = displen-1; i > 0; i--)
 								for i in range(displen-1, 0, -1):
 									displacement *= 2
-									next_bit = get_next_bits(infile, 1)
+									next_bit = get_next_bit(src)
 									
 									displacement |= next_bit
 
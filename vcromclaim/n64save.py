@@ -4,7 +4,8 @@
 # Description: Converts Virtual Console N64 saves to Mupen64Plus N64 saves.
 # The save formats used by N64 Virtual Console games were reverse engineered by Bryan Cain.
 
-import os, shutil, struct
+import os, shutil
+from array import array
 
 # Converts (byte-swaps) Nintendo N64 SRAM and/or Flash RAM saves to little endian
 # SRAM and/or Flash RAM saves that can be used by Mupen64Plus and other emulators.
@@ -29,8 +30,9 @@ def convert_sram(src, name, size):
 			if len(data) != 0: raise ValueError('SRAM save file size should be a multiple of 8 KB')
 			break
 		
-		intdata = struct.unpack('>2048I', data)
-		outfile.write(struct.pack('<2048I', *intdata))
+		words = array('I', data)
+		words.byteswap()
+		outfile.write(words.tostring())
 	
 	outfile.close()
 	infile.close()
@@ -12,8 +12,9 @@ def extract_nes_rom(app1):
 	romoffset = 0
 	while True:
 		buf = app1.read(8192)
-		if buf.find('NES\x1a') >= 0: # Found NES ROM
-			romoffset += buf.find('NES\x1a')
+		index = buf.find('NES\x1a')
+		if index >= 0: # Found NES ROM
+			romoffset += index
 			break
 		elif len(buf) != 8192: # End of file, and no NES rom found
 			app1.close()
@@ -16,13 +16,8 @@ from cStringIO import StringIO
 def restore_brr_samples(vcrom, pcm):
 	# read the samples from the input ROM into memory (TODO: check file size first)
 	vcrom.seek(0)
-	str = vcrom.read()
-	samplestart = str.find('PCMF') # samples start with first instance of the string "PCMF"
-	str = str[samplestart:]
-	
-	# initialize output ROM in memory as a StringIO (pseudo-file)
-	rom = StringIO()
-	rom.write(str)
+	rom = bytearray(vcrom.read())
+	samplestart = rom.find('PCMF') # samples start with first instance of the string "PCMF"
 	
 	# read the input BRR samples
 	#brr.seek(0)
@@ -38,15 +33,15 @@ def restore_brr_samples(vcrom, pcm):
 	controlwrong = 0
 	indices = []
 	
-	while str.find('PCMF') >= 0:
-		index = str.find('PCMF')
-		filepos = samplestart + index
+	index = samplestart
+	while index >= 0:
+		filepos = index
 		
 		# error checking to prevent infinite loops
 		#assert index not in indices
 		#indices.append(index)
 		
-		pcmf, pcmoffset = struct.unpack('<4sI', str[index:index+8])
+		pcmf, pcmoffset = struct.unpack_from('<4sI', rom, index)
 		pcmoffset &= 0xffffff
 		if pcmoffset % 16 or pcmoffset < lastpcmoffset:
 			#print '%08x: unexpected offset %d' % (filepos, pcmoffset)
@@ -66,15 +61,15 @@ def restore_brr_samples(vcrom, pcm):
 			raise ValueError('Invalid BRR offset: %d' % brroffset)
 		
 		# set the END bit in the BRR sample if it is set in the PCMF block
-		if ord(str[index+7]) & 1:
+		if rom[index+7] & 1:
 			brrsample = chr(ord(brrsample[0]) | 1) + brrsample[1:]
 		
 		# set the LOOP bit in the BRR sample if it is set in the PCMF block
-		if ord(str[index+7]) & 2:
+		if rom[index+7] & 2:
 			brrsample = chr(ord(brrsample[0]) | 2) + brrsample[1:]
 		
 		# checks whether sample matches the original ROM, when the original ROM is available (for debugging purposes)
-		'''goodrom.seek(samplestart + index)
+		'''goodrom.seek(filepos)
 		grsample = goodrom.read(9)
 		if brrsample != grsample:
 			wrong += 1
@@ -90,17 +85,17 @@ def restore_brr_samples(vcrom, pcm):
 			else:
 				print 'sample encoded differently?' '''
 		
-		rom.seek(index)
-		rom.write(brrsample)
-		str = rom.getvalue()
+		rom[index:index+9] = brrsample
 		lastpcmoffset = pcmoffset
+		
+		# the block just written replaced this PCMF, and nothing before it has one;
+		# look again from the earliest point a new PCMF could start
+		index = rom.find('PCMF', max(index - 3, samplestart))
 	
 	#print '%d wrong samples' % wrong
 	#print '%d differences in SPC700 control bits' % controlwrong
 	
-	rom.close()
-	vcrom.seek(0)
-	return vcrom.read(samplestart) + str
+	return bytes(rom)
 
 if __name__ == '__main__':
 	import time
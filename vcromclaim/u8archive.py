@@ -25,14 +25,16 @@ class U8Archive(object):
 		assert rootnode_offset == 0x20
 		assert self.file.read(16) == 16 * '\0'
 		
-		root = Node(self.file, rootnode_offset)
+		# the node table and string table together take up header_size bytes
+		table = self.file.read(header_size)
+		root = Node(table, 0, 0)
 		root.path = '<root>'
 		path = ''
 		curdirs = [root.size]
 		dirnames = ['<root>']
 		filenum = 1
 		while curdirs:
-			node = Node(self.file, rootnode_offset + 12 * root.size)
+			node = Node(table, 12 * filenum, 12 * root.size)
 			node.path = posixpath.join(path, node.name)
 			filenum += 1
 			if node.type == 0x100:
@@ -43,8 +45,6 @@ class U8Archive(object):
 				dirnames.append(node.name)
 			else: self.files.append(node)
 			
-			indices = range(len(curdirs))
-			indices.reverse()
 			while curdirs and filenum >= curdirs[len(curdirs)-1]:
 				#print 'done with ' + dirnames.pop() + ' at %d' % filenum
 				path = posixpath.dirname(path)
@@ -54,11 +54,12 @@ class U8Archive(object):
 	def close(self):
 		self.file.close()
 	
-	# returns True if this archive has a file with the given path
+	# returns True if this archive has a file with the given path; only the file
+	# table is checked, so the file is not read or decompressed
 	def hasfile(self, path):
-		f = self.getfile(path)
-		if f: f.close(); return True
-		else: return False
+		for node in self.files:
+			if node == path or (type(path) == str and node.name.endswith(path)): return True
+		return False
 	
 	# returns a file-like object (actually a cStringIO object) for the specified
 	# file; detects and decompresses compressed files (LZ77/Huf8/LZH8) automatically!
@@ -99,9 +100,7 @@ class U8Archive(object):
 					return decompressed_file
 				elif path.startswith("LZH8"):
 					try:
-						decompressed_file = StringIO()
-						decompressed_file.write(lzh8.decompress(file))
-						decompressed_file.seek(0)
+						decompressed_file = StringIO(lzh8.decompress(file))
 						file.close()
 						return decompressed_file
 					except Exception:
@@ -117,8 +116,8 @@ class U8Archive(object):
 	
 	# finds a file with the given name, accounting for compression prefixes like "LZ77", "Huf8", etc.
 	def findfile(self, name):
+		names = (name, "LZ77"+name, "LZ77_"+name, "Huf8"+name, "Huf8_"+name, "LZH8"+name, "LZH8_"+name)
 		for f in self.files:
-			names = (name, "LZ77"+name, "LZ77_"+name, "Huf8"+name, "Huf8_"+name, "LZH8"+name, "LZH8_"+name)
 			if f.name in names: return f.name
 		return None
 	
@@ -134,18 +133,26 @@ class U8Archive(object):
 				path = os.path.join(dest, node.path)
 				if not os.path.lexists(os.path.dirname(path)): os.makedirs(os.path.dirname(path))
 				f = open(path, 'wb')
-				contents = self.getfile(node)
-				contents.seek(0)
-				f.write(contents.read())
+				if node.name.startswith(('LZ77', 'Huf8', 'LZH8')):
+					contents = self.getfile(node)
+					contents.seek(0)
+					f.write(contents.read())
+				else:
+					# stored files need no decoding, so copy them straight out of the archive
+					self.file.seek(node.data_offset)
+					f.write(self.file.read(node.size))
 				f.close()
 				#print 'extracted file %s' % os.path.join(dest, node.path)
 
 # file node object
 class Node(object):
-	def __init__(self, arcfile, stringoffset):
-		self.rawdata = arcfile.read(12)
-		arcpos = arcfile.tell()
-		chunk1, self.data_offset, self.size = tuple(struct.unpack('>III', self.rawdata))
+	entry = struct.Struct('>III')
+	
+	# table: string holding the archive's node table followed by its string table
+	# offset: position of this node in the table
+	# stringoffset: position of the string table in the table
+	def __init__(self, table, offset, stringoffset):
+		chunk1, self.data_offset, self.size = self.entry.unpack_from(table, offset)
 		self.type = chunk1 >> 16
 		self.name_offset = chunk1 & 0xffffff
 		
@@ -153,11 +160,9 @@ class Node(object):
 		if not self.name_offset: return
 		
 		# no sane file name should be more than 64 bytes; if one is, string.index() will throw an exception
-		arcfile.seek(stringoffset + self.name_offset)
-		self.name = arcfile.read(64)
-		self.name = self.name[0:self.name.index('\0')]
+		start = stringoffset + self.name_offset
+		self.name = table[start:table.index('\0', start, start + 64)]
 		#print self.name
-		arcfile.seek(arcpos)
 
 if __name__ == '__main__':
 	# Quick functionality test and sanity check; will only work on my (Plombo's) computer without a path change
@@ -17,7 +17,7 @@ from snesrestore import restore_brr_samples
 # path: string (filesystem path)
 def writerom(rom, path):
 	f = open(path, 'wb')
-	f.write(rom.read())
+	shutil.copyfileobj(rom, f)
 	f.close()
 	rom.seek(0)
 
@@ -92,10 +92,12 @@ class RomExtractor(object):
 		
 		# make sure save flag is set if the game has save data
 		if self.extractsave():
-			if not (ord(rom.getvalue()[6]) & 2):
-				rom = list(rom.getvalue())
-				rom[6] = chr(ord(rom[6]) | 2)
-				rom = StringIO(''.join(rom))
+			rom.seek(6)
+			flags = ord(rom.read(1))
+			rom.seek(0)
+			if not (flags & 2):
+				data = rom.getvalue()
+				rom = StringIO(data[:6] + chr(flags | 2) + data[7:])
 				print 'Set the save flag to true'
 			
 		print 'Got ROM: %s' % filename
@@ -103,12 +105,17 @@ class RomExtractor(object):
 		return True
 	
 	def extractrom_n64(self, arc, filename):
-		if arc.hasfile('rom'):
-			rom = arc.getfile('rom')
+		# hasfile only checks the file table, so getfile can still return None
+		# if the file fails to decompress; fall back to romc in that case
+		rom = None
+		if arc.hasfile('rom'): rom = arc.getfile('rom')
+		
+		if rom:
 			print 'Got ROM: %s' % filename
 			writerom(rom, filename)
 		elif arc.hasfile('romc'):
 			rom = arc.getfile('romc')
+			if not rom: return False
 			print 'Decompressing ROM: %s (this could take a minute or two)' % filename
 			try:
 				romdata = romc.decompress(rom)
@@ -131,8 +138,11 @@ class RomExtractor(object):
 		return True
 	
 	def extractrom_sega(self, arc, filename):
-		if arc.hasfile('data.ccf'):
-			ccf = CCFArchive(arc.getfile('data.ccf'))
+		ccffile = None
+		if arc.hasfile('data.ccf'): ccffile = arc.getfile('data.ccf')
+		
+		if ccffile:
+			ccf = CCFArchive(ccffile)
 		
 			if ccf.hasfile('config'):
 				for line in ccf.getfile('config'):
@@ -182,9 +192,11 @@ class RomExtractor(object):
 	def extractrom_snes(self, arc, filename):
 		extracted = False
 		
+		# split each path into its dot-separated parts once, up front
+		paths = [(f, f.path.split('.')) for f in arc.files]
+		
 		# try to find the original ROM first
-		for f in arc.files:
-			path = f.path.split('.')
+		for f, path in paths:
 			if len(path) == 2 and path[0].startswith('SN') and path[1].isdigit():
 				print 'Found original ROM: %s' % f.path
 				rom = arc.getfile(f.path)
@@ -195,8 +207,7 @@ class RomExtractor(object):
 	
 		# if original ROM not present, try to create a playable ROM by recreating and injecting the original sounds
 		if not extracted:
-			for f in arc.files:
-				path = f.path.split('.')
+			for f, path in paths:
 				if len(path) == 2 and path[1] == 'rom':
 					print "Recreating original ROM from %s" % f.path
 					vcrom = arc.getfile(f.path)
@@ -204,8 +215,7 @@ class RomExtractor(object):
 			
 					# find raw PCM data
 					pcm = None
-					for f2 in arc.files:
-						path2 = f2.path.split('.')
+					for f2, path2 in paths:
 						if len(path2) == 2 and path2[1] == 'pcm':
 							pcm = arc.getfile(f2.path)
 					if not pcm: print 'Error: PCM audio data not found'; return False
@@ -259,7 +269,7 @@ class RomExtractor(object):
 					infile = open(path, 'rb')
 					outfile = open(outpath, 'wb')
 					infile.seek(64)
-					outfile.write(infile.read())
+					shutil.copyfileobj(infile, outfile)
 					outfile.close()
 					infile.close()
 					return True
@@ -308,6 +318,8 @@ class RomExtractor(object):
 		return False
 
 class NandDump(object):
+	content_record = struct.Struct('>IHHQ')
+	
 	# path: path on filesystem to the extracted NAND dump
 	def __init__(self, path):
 		self.path = path + '/'
@@ -333,13 +345,13 @@ class NandDump(object):
 	# Returns a string denoting the channel type.  Returns None if it's not a VC game.
 	def channeltype(self, ticket):
 		f = open(os.path.join(self.path, 'ticket', '00010001', ticket), 'rb')
+		# title type at 0x1dc must be 0x00010001, and the byte at 0x221 must be 1
 		f.seek(0x1dc)
-		thistype = struct.unpack('>I', f.read(4))[0]
-		if thistype != 0x10001: return None
-		f.seek(0x221)
-		if struct.unpack('>B', f.read(1))[0] != 1: return None
-		f.seek(0x1e0)
-		ident = f.read(2)
+		header = f.read(0x46)
+		f.close()
+		if header[0:4] != '\x00\x01\x00\x01': return None
+		if header[0x45:0x46] != '\x01': return None
+		ident = header[4:6]
 		
 		# TODO: support the commented game types
 		if ident[0] == 'F': return 'NES'
@@ -361,10 +373,13 @@ class NandDump(object):
 		f.seek(0x1de)
 		count = struct.unpack('>H', f.read(2))[0]
 		f.seek(0x1e4)
+		# each content record is 36 bytes (16 bytes of fields then a 20-byte hash);
+		# read the whole table at once and decode the fields in place
+		records = f.read(36 * count)
+		f.close()
 		appname = None
-		for i in range(count):
-			info = struct.unpack('>IHHQ', f.read(16))
-			f.read(20)
+		for offset in xrange(0, 36 * count, 36):
+			info = self.content_record.unpack_from(records, offset)
 			if info[1] == 0:
 				appname = '%08x.app' % info[0]
 		return appname
@@ -374,9 +389,14 @@ class NandDump(object):
 		path = os.path.join(self.path, path)
 		if not os.path.exists(path): return None
 		f = open(path, 'rb')
-		data = f.read()
-		f.close()
+		# the IMET header sits near the start of the file, so look there before
+		# reading the rest of what can be a multi-megabyte banner
+		data = f.read(0x400)
 		index = data.find('IMET')
+		if index < 0 or index + 29 + 84 * 2 > len(data):
+			data += f.read()
+			index = data.find('IMET')
+		f.close()
 		if index < 0: return None
 		engindex = index + 29 + 84
 		title = data[engindex:engindex+84]